@@ -2,7 +2,7 @@
 
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any
 
 
@@ -389,8 +389,8 @@ class BaseFormatter(ABC):
 
     @property
     @abstractmethod
-    def TYPE_MAP(self) -> dict[str, str]:
-        """Type mapping dictionary for the formatter."""
+    def TYPE_MAP(self) -> Mapping[str, str]:
+        """Type mapping for the formatter; implementations return a shared constant."""
         pass
 
     @property
@@ -424,6 +424,10 @@ class BaseFormatter(ABC):
         if self._global_expansion_count >= self._global_expansion_budget:
             return "object"  # Hit global budget limit
 
+        # Stop descending once a chain of distinct refs gets too deep
+        if len(self._ref_expansion_path) >= self._max_ref_depth:
+            return "object"
+
         # Create expansion fingerprint to detect circular patterns
         expansion_fingerprint = "->".join(self._ref_expansion_path + [ref_key])
         if expansion_fingerprint in self._expansion_fingerprints:
@@ -1,10 +1,17 @@
 """JSONish formatter for transforming Pydantic schemas into BAML-like format."""
 
 import json
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from .base import BaseFormatter
 
+_JSONISH_TYPE_MAP: Mapping[str, str] = MappingProxyType(
+    {"number": "float", "integer": "int", "boolean": "bool"}
+)
+
 
 class JSONishFormatter(BaseFormatter):
     """
@@ -20,6 +27,10 @@ class JSONishFormatter(BaseFormatter):
         }
     """
 
+    # Precompiled patterns used when post-processing the JSON output
+    QUOTED_KEY_PATTERN = re.compile(r'"([^"]+)"(\s*:\s*)')
+    ADDITIONAL_PROPERTIES_PATTERN = re.compile(r'"__additional_properties__"\s*:\s*"([^"]*)"')
+
     def __init__(self, schema: dict[str, Any], include_metadata: bool = True):
         """
         Initialize the JSONish formatter.
@@ -33,11 +44,12 @@ class JSONishFormatter(BaseFormatter):
         self.processed_ref_cache: dict[str, dict[str, Any] | str | list[Any]] = {}
         self.pending_postfix: dict[str, str] = {}
         self.simplified_schema: str | None = None
+        self._ref_chain_depth = 0  # Number of $refs currently being expanded
 
     @property
-    def TYPE_MAP(self) -> dict[str, str]:
+    def TYPE_MAP(self) -> Mapping[str, str]:
         """Type mapping for JSONish format."""
-        return {"number": "float", "integer": "int", "boolean": "bool"}
+        return _JSONISH_TYPE_MAP
 
     @property
     def comment_prefix(self) -> str:
@@ -151,8 +163,15 @@ class JSONishFormatter(BaseFormatter):
 
         if _ref in self.processed_ref_cache:
             output = self.processed_ref_cache[_ref]
+        elif self._ref_chain_depth >= self._max_ref_depth:
+            # Deeper levels of a $ref chain (or a self-referencing model) are not expanded
+            output = "object"
         else:
-            output = self._process_schema_recursive(_def)
+            self._ref_chain_depth += 1
+            try:
+                output = self._process_schema_recursive(_def)
+            finally:
+                self._ref_chain_depth -= 1
             self.processed_ref_cache[_ref] = output
         if "default" in value:
             if isinstance(output, str):
@@ -518,7 +537,7 @@ class JSONishFormatter(BaseFormatter):
             Processed schema as dict or string.
         """
         output: dict[str, Any] = {}
-        required = schema.get("required", [])
+        required = set(schema.get("required", []))
 
         # Base-case: an empty object schema like {"type": "object"} should render as
         # an empty object rather than recursing via process_types("object") and back here.
@@ -745,8 +764,6 @@ class JSONishFormatter(BaseFormatter):
         Returns:
             JSONish string without quotes.
         """
-        import re
-
         lines = json_string.split("\n")
         result_lines = []
 
@@ -772,7 +789,7 @@ class JSONishFormatter(BaseFormatter):
 
             # Remove quotes from keys: "key": -> key:
             # Pattern: "text": (with optional whitespace)
-            main_content = re.sub(r'"([^"]+)"(\s*:\s*)', r"\1\2", main_content)
+            main_content = self.QUOTED_KEY_PATTERN.sub(r"\1\2", main_content)
 
             # Remove quotes from string values
             # After removing key quotes, remaining quotes are on values
@@ -795,8 +812,6 @@ class JSONishFormatter(BaseFormatter):
         Returns:
             JSON string with __additional_properties__ converted to comments.
         """
-        import re
-
         lines = json_string.split("\n")
         result_lines = []
         i = 0
@@ -809,7 +824,7 @@ class JSONishFormatter(BaseFormatter):
             if "__additional_properties__" in line:
                 # Extract the value
                 # Pattern: "key": "value" or "key": "value",
-                match = re.search(r'"__additional_properties__"\s*:\s*"([^"]*)"', line)
+                match = self.ADDITIONAL_PROPERTIES_PATTERN.search(line)
                 if match:
                     comment_value = match.group(1)
 
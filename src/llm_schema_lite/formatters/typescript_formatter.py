@@ -1,10 +1,24 @@
 """TypeScript interface formatter for transforming Pydantic schemas."""
 
+from collections.abc import Mapping
 from io import StringIO
+from types import MappingProxyType
 from typing import Any
 
 from .base import BaseFormatter
 
+_TYPESCRIPT_TYPE_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "string": "string",
+        "integer": "number",
+        "number": "number",
+        "boolean": "boolean",
+        "array": "Array",
+        "object": "object",
+        "null": "null",
+    }
+)
+
 
 class TypeScriptFormatter(BaseFormatter):
     """
@@ -27,17 +41,9 @@ class TypeScriptFormatter(BaseFormatter):
     """
 
     @property
-    def TYPE_MAP(self) -> dict[str, str]:
+    def TYPE_MAP(self) -> Mapping[str, str]:
         """Type mapping for TypeScript format."""
-        return {
-            "string": "string",
-            "integer": "number",
-            "number": "number",
-            "boolean": "boolean",
-            "array": "Array",
-            "object": "object",
-            "null": "null",
-        }
+        return _TYPESCRIPT_TYPE_MAP
 
     @property
     def comment_prefix(self) -> str:
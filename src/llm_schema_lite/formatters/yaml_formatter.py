@@ -7,12 +7,26 @@ dependencies, and $ref default.
 """
 
 import json
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
 from .base import BaseFormatter
 
+_YAML_TYPE_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "string": "string",
+        "integer": "int",
+        "number": "float",
+        "boolean": "bool",
+        "array": "list",
+        "object": "dict",
+        "null": "None",
+    }
+)
+
 
 class YAMLFormatter(BaseFormatter):
     """
@@ -28,17 +42,9 @@ class YAMLFormatter(BaseFormatter):
     """
 
     @property
-    def TYPE_MAP(self) -> dict[str, str]:
+    def TYPE_MAP(self) -> Mapping[str, str]:
         """Type mapping for YAML format (aligned with JSONish: string, int, float, bool)."""
-        return {
-            "string": "string",
-            "integer": "int",
-            "number": "float",
-            "boolean": "bool",
-            "array": "list",
-            "object": "dict",
-            "null": "None",
-        }
+        return _YAML_TYPE_MAP
 
     def _get_title_description_default_value(
         self, value: dict[str, Any]
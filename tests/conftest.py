@@ -2,11 +2,14 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cache, lru_cache
 from typing import Any, Literal
 
 import pytest
 from pydantic import BaseModel, EmailStr, Field, HttpUrl
 
+from llm_schema_lite.parsers import JSONParser, YAMLParser
+
 # ============================================================================
 # Test Models and Schemas
 # ============================================================================
@@ -189,6 +192,12 @@ class Priority(int, Enum):
     CRITICAL = 4
 
 
+class StringEnumModel(BaseModel):
+    """Model with string enum."""
+
+    role: Role
+
+
 class IntEnumModel(BaseModel):
     """Model with integer enum."""
 
@@ -893,6 +902,42 @@ DEPRECATED_EXAMPLES_SCHEMA = {
 }
 
 
+# ============================================================================
+# Lazy Test Data Builders
+# ============================================================================
+# Bulky enum value lists are built on first use only and shared as immutable
+# tuples, so deselected tests never allocate them.
+
+
+@lru_cache(maxsize=1)
+def large_enum_values() -> tuple[str, ...]:
+    """Build a 100-value enum list."""
+    return tuple(f"value_{i}" for i in range(100))
+
+
+@lru_cache(maxsize=1)
+def long_enum_values() -> tuple[str, ...]:
+    """Build a short enum list whose values are very long strings."""
+    return tuple(f"very_long_value_{i}" * 10 for i in range(5))
+
+
+# Shared by every field of the wide schema; formatters only read nested schemas.
+_STRING_TYPE: dict[str, Any] = {"type": "string"}
+
+
+@lru_cache(maxsize=1)
+def wide_object_schema() -> dict[str, Any]:
+    """Build an object schema with 100 string fields sharing one type schema."""
+    properties = dict.fromkeys((f"field_{i}" for i in range(100)), _STRING_TYPE)
+    return {"type": "object", "properties": properties}
+
+
+@cache
+def cached_schema(model_cls: type[BaseModel]) -> dict[str, Any]:
+    """Build a model's JSON schema once per session; callers must treat it as read-only."""
+    return model_cls.model_json_schema()
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -1617,6 +1662,70 @@ def formatter_comment_symbols():
     return {"jsonish": "//", "typescript": "//", "yaml": "#"}
 
 
+# Session-scoped schemas for the formatter tests, backed by cached_schema(); tests
+# must treat these dicts as read-only.
+
+
+@pytest.fixture(scope="session")
+def simple_formatter_schema():
+    """Session-wide schema for SimpleFormatterModel."""
+    return cached_schema(SimpleFormatterModel)
+
+
+@pytest.fixture(scope="session")
+def person_with_address_schema():
+    """Session-wide schema for PersonWithAddress."""
+    return cached_schema(PersonWithAddress)
+
+
+@pytest.fixture(scope="session")
+def ordered_fields_schema():
+    """Session-wide schema for OrderedFieldsModel."""
+    return cached_schema(OrderedFieldsModel)
+
+
+@pytest.fixture(scope="session")
+def required_optional_schema():
+    """Session-wide schema for RequiredOptionalModel."""
+    return cached_schema(RequiredOptionalModel)
+
+
+@pytest.fixture(scope="session")
+def constrained_formatter_schema():
+    """Session-wide schema for ConstrainedFormatterModel."""
+    return cached_schema(ConstrainedFormatterModel)
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        SimpleFormatterModel,
+        RequiredOptionalModel,
+        OrderedFieldsModel,
+        ConstrainedFormatterModel,
+    ],
+    ids=lambda model_cls: model_cls.__name__,
+)
+def contract_model_schema(request):
+    """Session-wide schemas of the models used by the formatter contract tests."""
+    return cached_schema(request.param)
+
+
+# Parsers keep no per-call state, so one instance of each serves the whole session.
+
+
+@pytest.fixture(scope="session")
+def json_parser():
+    """Session-wide JSONParser."""
+    return JSONParser()
+
+
+@pytest.fixture(scope="session")
+def yaml_parser():
+    """Session-wide YAMLParser."""
+    return YAMLParser()
+
+
 # ============================================================================
 # Test Data Factories
 # ============================================================================
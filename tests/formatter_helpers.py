@@ -6,11 +6,43 @@ Currently focused on the JSONish formatter output shape.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 _FIELD_LINE_RE = re.compile(r"^\s*([a-zA-Z_][a-zA-Z0-9_]*)(\*)?\s*:")
 
 
+@lru_cache(maxsize=128)
+def _needles_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile an alternation matching any of `needles`, longest first."""
+
+    return re.compile("|".join(map(re.escape, sorted(needles, key=len, reverse=True))))
+
+
+def assert_contains_all(result: str, needles: tuple[str, ...]) -> None:
+    """Assert every needle occurs in `result`, scanning the output once.
+
+    Needles hidden by an overlapping match are re-checked with `in` before
+    failing, so the result is the same as one `in` check per needle.
+    """
+
+    found = {m.group(0) for m in _needles_pattern(needles).finditer(result)}
+    missing = [n for n in needles if n not in found and n not in result]
+    assert not missing, f"Expected {missing} in output. Snippet: {result[:300]!r}"
+
+
+def contains_any(result: str, needles: tuple[str, ...], *, case_insensitive: bool = False) -> bool:
+    """Return whether any needle occurs in `result`.
+
+    With `case_insensitive`, the output is lowercased once for all needles.
+    """
+
+    if case_insensitive:
+        result = result.lower()
+        needles = tuple(needle.lower() for needle in needles)
+    return any(needle in result for needle in needles)
+
+
 def parse_jsonish_root_fields(text: str) -> list[tuple[str, bool]]:
     """Parse root-level JSONish field lines.
 
@@ -46,6 +78,20 @@ def parse_jsonish_root_fields(text: str) -> list[tuple[str, bool]]:
     return fields
 
 
+def nonempty_noncomment_lines(text: str, comment_prefix: str = "//") -> tuple[str, ...]:
+    """Return the stripped lines of `text` that are neither blank nor comment-only.
+
+    Each line is stripped once; useful for checking the scaffolding (first/last
+    lines) of formatter output.
+    """
+
+    return tuple(
+        stripped
+        for line in text.splitlines()
+        if (stripped := line.strip()) and not stripped.startswith(comment_prefix)
+    )
+
+
 def parse_typescript_interface_fields(
     text: str, interface_name: str = "Schema"
 ) -> list[tuple[str, bool]]:
@@ -117,16 +163,28 @@ def parse_yaml_root_fields(text: str) -> list[tuple[str, bool]]:
     return fields
 
 
+def schema_field_sets(schema: dict[str, Any]) -> tuple[frozenset[str], frozenset[str]]:
+    """Return the schema's `(required, properties)` root field names as frozensets."""
+
+    return (
+        frozenset(schema.get("required", []) or []),
+        frozenset((schema.get("properties", {}) or {}).keys()),
+    )
+
+
 def assert_required_optional_fields_match_schema(
     fields: list[tuple[str, bool]], schema: dict[str, Any]
 ) -> None:
     """Assert parsed `(name, required)` fields match schema required/properties."""
 
-    required_in_schema = set(schema.get("required", []) or [])
-    properties_in_schema = set((schema.get("properties", {}) or {}).keys())
+    required_in_schema, properties_in_schema = schema_field_sets(schema)
 
-    field_names = {name for name, _ in fields}
-    required_in_output = {name for name, is_req in fields if is_req}
+    field_names: set[str] = set()
+    required_in_output: set[str] = set()
+    for name, is_req in fields:
+        field_names.add(name)
+        if is_req:
+            required_in_output.add(name)
 
     missing_props = properties_in_schema - field_names
     assert not missing_props, f"Missing properties in output: {sorted(missing_props)}"
@@ -154,8 +212,7 @@ def assert_schema_title_comment_consistent(
 def assert_required_optional_consistent(result: str, schema: dict[str, Any]) -> None:
     """Assert that required fields are marked with '*' and optional fields are not."""
 
-    required = set(schema.get("required", []) or [])
-    properties = set((schema.get("properties", {}) or {}).keys())
+    required, properties = schema_field_sets(schema)
 
     # If schema has no properties, there's nothing to check.
     if not properties:
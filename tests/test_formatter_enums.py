@@ -0,0 +1,93 @@
+"""Shared enum rendering and output tests for all formatters."""
+
+from __future__ import annotations
+
+import pytest
+
+from llm_schema_lite.formatters.base import BaseFormatter
+from llm_schema_lite.formatters.jsonish_formatter import JSONishFormatter
+from llm_schema_lite.formatters.typescript_formatter import TypeScriptFormatter
+from llm_schema_lite.formatters.yaml_formatter import YAMLFormatter
+from tests.conftest import EMPTY_SCHEMA, large_enum_values, long_enum_values
+
+
+class FormatterEnumTestsMixin:
+    """Enum tests authored once and run against each formatter.
+
+    Concrete subclasses only describe how their formatter renders a multi-value enum.
+    """
+
+    formatter_cls: type[BaseFormatter]
+    options_prefix: str
+    separator: str
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def enum_formatter(cls) -> BaseFormatter:
+        """One formatter per class; process_enum only reads its argument."""
+        return cls.formatter_cls(EMPTY_SCHEMA, include_metadata=False)
+
+    @staticmethod
+    def _process_enum(formatter: BaseFormatter, values: list[object]) -> str:
+        return formatter.process_enum({"type": "string", "enum": values})
+
+    def _split_options(self, result: str) -> list[str]:
+        assert result.startswith(self.options_prefix)
+        return result.removeprefix(self.options_prefix).split(self.separator)
+
+    def test_single_value_is_bare(self, enum_formatter):
+        """A single-value enum renders as the value itself."""
+        assert self._process_enum(enum_formatter, ["only"]) == "only"
+
+    def test_multiple_values_keep_order(self, enum_formatter):
+        """Every value of a multi-value enum is listed in schema order."""
+        values = ["draft", "published", "archived"]
+        assert self._split_options(self._process_enum(enum_formatter, values)) == values
+
+    @pytest.mark.parametrize(
+        "build_values",
+        [large_enum_values, long_enum_values],
+        ids=["large_enum", "long_values"],
+    )
+    def test_bulky_enum(self, enum_formatter, build_values):
+        """Large or long-valued enums list every value."""
+        values = list(build_values())
+        assert self._split_options(self._process_enum(enum_formatter, values)) == values
+
+
+class TestJSONishEnum(FormatterEnumTestsMixin):
+    formatter_cls = JSONishFormatter
+    options_prefix = "OPTIONS: "
+    separator = "| "
+
+
+class TestTypeScriptEnum(FormatterEnumTestsMixin):
+    formatter_cls = TypeScriptFormatter
+    options_prefix = ""
+    separator = " | "
+
+
+@pytest.mark.yaml
+class TestYAMLEnum(FormatterEnumTestsMixin):
+    formatter_cls = YAMLFormatter
+    options_prefix = "OPTIONS: "
+    separator = "| "
+
+
+@pytest.mark.parametrize(
+    "formatter_cls",
+    [
+        JSONishFormatter,
+        TypeScriptFormatter,
+        pytest.param(YAMLFormatter, marks=pytest.mark.yaml),
+    ],
+)
+def test_output_matches_across_instances(formatter_cls, person_with_address_schema):
+    """Separate formatters for one schema render the same output on first and repeat calls."""
+    first = formatter_cls(person_with_address_schema, include_metadata=True)
+    second = formatter_cls(person_with_address_schema, include_metadata=True)
+
+    first_results = [first.transform_schema(), first.transform_schema()]
+
+    assert all(first_results)
+    assert [second.transform_schema(), second.transform_schema()] == first_results
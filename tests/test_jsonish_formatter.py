@@ -8,30 +8,80 @@ import pytest
 
 from llm_schema_lite.formatters.jsonish_formatter import JSONishFormatter
 from tests.conftest import (
+    ALL_OF_SCHEMA,
+    ANY_OF_SCHEMA,
+    CONST_SCHEMA,
+    DEPENDENCY_SCHEMA,
     EMPTY_SCHEMA,
-    ConstrainedFormatterModel,
-    OrderedFieldsModel,
-    PersonWithAddress,
-    RequiredOptionalModel,
+    ONE_OF_SCHEMA,
+    AllOfLike,
+    ArrayMinMaxItems,
+    ArrayOfRefsModel,
+    ArrayOfStrings,
+    ArrayUniqueItems,
+    BoolLiterals,
+    ComplexTypes,
+    DeepNested,
+    DictOnlyModel,
+    EventWithDate,
+    ExclusiveMinMax,
+    FullFeaturedModel,
+    IntEnumModel,
+    IntLiterals,
+    IssueClassification,
+    LiteralSingle,
+    LiteralUnion,
+    MixedTypeLiterals,
+    ObjectAdditionalPropsFalse,
+    ObjectWithDefaults,
+    PatternConstraints,
     SimpleFormatterModel,
+    SingleConstInt,
+    StringEnumModel,
+    StringFormatEmail,
+    StringFormatUri,
+    StringPattern,
+    UnionHeavy,
+    UnionTypes,
+    WithFieldDescriptions,
+    WithTitleDescription,
+    cached_schema,
 )
 from tests.formatter_helpers import (
+    assert_contains_all,
     assert_required_optional_consistent,
+    assert_required_optional_fields_match_schema,
     assert_schema_info_comment_presence,
+    contains_any,
+    nonempty_noncomment_lines,
     parse_jsonish_root_fields,
+    schema_field_sets,
 )
 
 # Alias for backwards compatibility in tests
 SimpleModel = SimpleFormatterModel
 
+# Patterns compiled once instead of on every test call
+_STREET_RE = re.compile(r"['\"]street\*['\"]\s*:")
+_CITY_RE = re.compile(r"['\"]city\*['\"]\s*:")
+_WS_RE = re.compile(r"[ ]{2,}")
+_REQUIRED_MARK_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*\*:")
+_NUMERIC_RANGE_RE = re.compile(r"\(0(\.0)? to 100(\.0)?\)")
+_ORDERED_FIELD_RE = re.compile(r"(first|second|third)\*:")
+_ZULU_ALPHA_MIKE_RE = re.compile(r"(zulu|alpha|mike)\*:")
 
-def test_jsonish_formatter_produces_valid_output():
+
+@pytest.fixture(scope="module")
+def jsonish_simple_output(simple_formatter_schema):
+    """JSONish rendering of the simple model with metadata, built once per module."""
+    return JSONishFormatter(simple_formatter_schema, include_metadata=True).transform_schema()
+
+
+def test_jsonish_formatter_produces_valid_output(simple_formatter_schema, jsonish_simple_output):
     """Test that JSONish formatter produces valid output with required fields marked."""
-    schema = SimpleModel.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=True)
-    result = formatter.transform_schema()
+    result = jsonish_simple_output
 
-    assert_required_optional_consistent(result, schema)
+    assert_required_optional_consistent(result, simple_formatter_schema)
     assert_schema_info_comment_presence(result, include_metadata=True)
 
     # Verify asterisk notation comment is present (schema has required fields)
@@ -39,9 +89,9 @@ def test_jsonish_formatter_produces_valid_output():
     assert "//" in result  # JSONish comment prefix
 
 
-def test_jsonish_formatter_without_metadata():
+def test_jsonish_formatter_without_metadata(simple_formatter_schema):
     """Test JSONish formatter without metadata."""
-    schema = SimpleModel.model_json_schema()
+    schema = simple_formatter_schema
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -52,9 +102,9 @@ def test_jsonish_formatter_without_metadata():
     assert "//Title:" not in result
 
 
-def test_jsonish_formatter_with_nested_defs():
+def test_jsonish_formatter_with_nested_defs(person_with_address_schema):
     """Test JSONish formatter with nested $defs."""
-    schema = PersonWithAddress.model_json_schema()
+    schema = person_with_address_schema
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -66,33 +116,94 @@ def test_jsonish_formatter_with_nested_defs():
     # Should contain nested Address required fields (expanded)
     # JSONish nested rendering may appear either as `street*:` (object expanded) or
     # as a python-dict-like string `'<street*>': ...` depending on recursion path.
-    assert ("street*:" in result) or re.search(r"['\"]street\*['\"]\s*:", result)
-    assert ("city*:" in result) or re.search(r"['\"]city\*['\"]\s*:", result)
+    assert ("street*:" in result) or _STREET_RE.search(result)
+    assert ("city*:" in result) or _CITY_RE.search(result)
+
+
+def _ref_chain_schema(depth: int) -> dict:
+    """Object whose `root` is a chain of `depth` distinct $defs, one field per level."""
+    defs = {}
+    for i in range(depth):
+        props = {f"level{i}": {"type": "string"}}
+        if i < depth - 1:
+            props["child"] = {"$ref": f"#/$defs/L{i + 1}"}
+        defs[f"L{i}"] = {"type": "object", "properties": props}
+    return {"type": "object", "properties": {"root": {"$ref": "#/$defs/L0"}}, "$defs": defs}
+
+
+_SELF_REF_SCHEMA = {
+    "type": "object",
+    "properties": {"root": {"$ref": "#/$defs/Node"}},
+    "$defs": {
+        "Node": {
+            "type": "object",
+            "properties": {"value": {"type": "string"}, "child": {"$ref": "#/$defs/Node"}},
+        }
+    },
+}
+
+
+_SELF_REF_LIST_SCHEMA = {
+    "type": "object",
+    "properties": {"root": {"$ref": "#/$defs/Node"}},
+    "$defs": {
+        "Node": {
+            "type": "object",
+            "properties": {
+                "value": {"type": "string"},
+                "children": {"type": "array", "items": {"$ref": "#/$defs/Node"}, "default": []},
+            },
+            "required": ["value"],
+        }
+    },
+}
+
+
+def test_jsonish_formatter_collapses_deep_ref_chains():
+    """Only the first two levels of a $ref chain are expanded."""
+    result = JSONishFormatter(_ref_chain_schema(50), include_metadata=False).transform_schema()
 
+    assert_contains_all(result, ("level0", "level1"))
+    assert "level2" not in result
 
-def test_jsonish_formatter_key_order_preserved():
+
+@pytest.mark.parametrize(
+    "schema",
+    [_ref_chain_schema(50), _SELF_REF_SCHEMA, _SELF_REF_LIST_SCHEMA],
+    ids=["ref_chain", "self_ref", "self_ref_list"],
+)
+def test_jsonish_formatter_keeps_recursive_refs_short(schema):
+    """Deep and self-referencing $refs collapse to a short, unescaped object."""
+    # A self-referencing definition used to hit RecursionError, then nested ten escaped levels
+    result = JSONishFormatter(schema, include_metadata=False).transform_schema()
+
+    assert len(result) < 200, f"Output too long ({len(result)} chars): {result[:300]!r}"
+    assert "\\'" not in result
+    assert "'object" in result
+
+
+def test_jsonish_formatter_key_order_preserved(ordered_fields_schema):
     """Test that JSONish formatter preserves key order (dict order)."""
-    schema = OrderedFieldsModel.model_json_schema()
+    schema = ordered_fields_schema
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    # Find positions of each field in the output
-    first_pos = result.find("first*:")
-    second_pos = result.find("second*:")
-    third_pos = result.find("third*:")
+    # Find positions of each field in a single pass over the output
+    positions: dict[str, int] = {}
+    for m in _ORDERED_FIELD_RE.finditer(result):
+        positions.setdefault(m.group(1), m.start())
 
     # Verify all fields are present
-    assert first_pos != -1, f"Expected 'first*:' in output. Snippet: {result[:200]!r}"
-    assert second_pos != -1, f"Expected 'second*:' in output. Snippet: {result[:200]!r}"
-    assert third_pos != -1, f"Expected 'third*:' in output. Snippet: {result[:200]!r}"
+    missing = {"first", "second", "third"} - positions.keys()
+    assert not missing, f"Expected {sorted(missing)} in output. Snippet: {result[:200]!r}"
 
     # Check that fields appear in order
-    assert first_pos < second_pos < third_pos
+    assert positions["first"] < positions["second"] < positions["third"]
 
 
-def test_jsonish_formatter_caching():
+def test_jsonish_formatter_caching(simple_formatter_schema):
     """Test that formatter caching works correctly."""
-    schema = SimpleModel.model_json_schema()
+    schema = simple_formatter_schema
     formatter = JSONishFormatter(schema, include_metadata=True)
 
     # First call
@@ -106,17 +217,14 @@ def test_jsonish_formatter_caching():
 
     # The first call returns the pre-normalized string, while subsequent calls
     # return the cached normalized string. Compare after normalizing whitespace.
-    def _normalize_spaces(s: str) -> str:
-        return re.sub(r"[ ]{2,}", " ", s)
-
-    assert _normalize_spaces(result1) == _normalize_spaces(result2)
+    assert _WS_RE.sub(" ", result1) == _WS_RE.sub(" ", result2)
     assert result2 == formatter.simplified_schema
     assert_required_optional_consistent(result2, schema)
 
 
-def test_jsonish_formatter_with_constraints():
+def test_jsonish_formatter_with_constraints(constrained_formatter_schema):
     """Test that JSONish formatter includes field constraints."""
-    schema = ConstrainedFormatterModel.model_json_schema()
+    schema = constrained_formatter_schema
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -134,15 +242,15 @@ def test_jsonish_formatter_with_constraints():
     ), f"Expected integer range constraint '(0 to 150)' in output. Snippet: {result[:300]!r}"
 
     assert "score*:" in result
-    assert re.search(r"\(0(\.0)? to 100(\.0)?\)", result), (
+    assert _NUMERIC_RANGE_RE.search(result), (
         "Expected numeric range constraint '(0.0 to 100.0)' (or int form) in output. "
         f"Snippet: {result[:350]!r}"
     )
 
 
-def test_jsonish_formatter_with_optional_union():
+def test_jsonish_formatter_with_optional_union(required_optional_schema):
     """Test that JSONish formatter handles optional fields (union with None)."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = required_optional_schema
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -154,46 +262,24 @@ def test_jsonish_formatter_with_optional_union():
     assert "optional_field*:" not in result
 
 
-def test_required_optional_parsing_matches_schema():
+def test_required_optional_parsing_matches_schema(required_optional_schema):
     """Root-field parsing should match schema required/properties exactly."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = required_optional_schema
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    fields = parse_jsonish_root_fields(result)
-    field_names = {name for name, _ in fields}
-    required_in_output = {name for name, is_req in fields if is_req}
-
-    required_in_schema = set(schema.get("required", []) or [])
-    properties_in_schema = set((schema.get("properties", {}) or {}).keys())
-
-    missing_props = properties_in_schema - field_names
-    assert not missing_props, f"Missing properties in output: {sorted(missing_props)}"
+    assert_required_optional_fields_match_schema(parse_jsonish_root_fields(result), schema)
 
-    assert required_in_output == required_in_schema, (
-        f"Required fields in output should match schema. "
-        f"schema={sorted(required_in_schema)} output={sorted(required_in_output)}"
-    )
 
-
-@pytest.mark.parametrize(
-    "model_cls",
-    [
-        SimpleFormatterModel,
-        RequiredOptionalModel,
-        OrderedFieldsModel,
-        ConstrainedFormatterModel,
-    ],
-)
-def test_jsonish_lists_all_root_properties_for_models(model_cls):
+def test_jsonish_lists_all_root_properties_for_models(contract_model_schema):
     """Contract: output lists all schema root properties as field lines."""
-    schema = model_cls.model_json_schema()
+    schema = contract_model_schema
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     fields = parse_jsonish_root_fields(result)
     field_names = {name for name, _ in fields}
-    expected_props = set((schema.get("properties", {}) or {}).keys())
+    _, expected_props = schema_field_sets(schema)
 
     missing = expected_props - field_names
     assert not missing, (
@@ -202,36 +288,46 @@ def test_jsonish_lists_all_root_properties_for_models(model_cls):
     )
 
 
-@pytest.mark.parametrize(
-    "model_cls",
-    [
-        SimpleFormatterModel,
-        RequiredOptionalModel,
-        OrderedFieldsModel,
-        ConstrainedFormatterModel,
-    ],
-)
-def test_jsonish_required_optional_consistent_for_models(model_cls):
+def test_jsonish_required_optional_consistent_for_models(contract_model_schema):
     """Contract: required/optional marking matches schema required list."""
-    schema = model_cls.model_json_schema()
+    schema = contract_model_schema
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
     assert_required_optional_consistent(result, schema)
 
 
-def test_jsonish_format_scaffolding_regression():
+def test_jsonish_format_scaffolding_regression(jsonish_simple_output):
     """Regression: basic scaffolding is stable for a simple model."""
-    schema = SimpleFormatterModel.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=True)
-    result = formatter.transform_schema()
+    result = jsonish_simple_output
 
-    # First non-comment non-empty line should be the opening brace.
-    lines = [
-        ln.strip() for ln in result.splitlines() if ln.strip() and not ln.strip().startswith("//")
-    ]
+    # First/last non-comment non-empty lines should be the braces
+    lines = nonempty_noncomment_lines(result)
     assert lines, "Expected non-empty output"
-    assert lines[0] == "{", f"Expected opening '{{' line, got: {lines[0]!r}"
-    assert lines[-1] == "}", f"Expected closing '}}' line, got: {lines[-1]!r}"
+    first, last = lines[0], lines[-1]
+    assert first == "{", f"Expected opening '{{' line, got: {first!r}"
+    assert last == "}", f"Expected closing '}}' line, got: {last!r}"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected_substrs"),
+    [
+        ({}, ["{}"]),
+        ({"user": {"name": "string", "age": "int"}}, ["user", "name", "age"]),
+        (["string", "int", "bool"], ["string", "int", "bool"]),
+        (None, ["None"]),
+        ("test", ["test"]),
+        (123, ["123"]),
+        (True, ["True"]),
+    ],
+    ids=["empty_dict", "nested_dict", "list", "none", "str", "int", "bool"],
+)
+def test_jsonish_dict_to_string(value, expected_substrs):
+    """dict_to_string renders dicts, lists and primitives with every expected token."""
+    formatter = JSONishFormatter(EMPTY_SCHEMA, include_metadata=False)
+    result = formatter.dict_to_string(value)
+
+    missing = [s for s in expected_substrs if s not in result]
+    assert not missing, f"Missing {missing} in {result!r}"
 
 
 def test_empty_object_schema():
@@ -260,7 +356,7 @@ def test_all_optional_no_asterisks():
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    assert not re.search(r"[a-zA-Z_][a-zA-Z0-9_]*\*:", result), (
+    assert not _REQUIRED_MARK_RE.search(result), (
         "Did not expect any required markers ('*:') when schema has no required fields. "
         f"Snippet: {result[:250]!r}"
     )
@@ -273,187 +369,68 @@ def test_all_optional_no_asterisks():
 
 def test_jsonish_formatter_with_string_enum():
     """Test JSONish formatter with string enum (Role)."""
-    from pydantic import BaseModel
-
-    from tests.conftest import Role
-
-    class RoleModel(BaseModel):
-        """Model with role enum."""
-
-        role: Role
-
-    schema = RoleModel.model_json_schema()
+    schema = cached_schema(StringEnumModel)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     # Should contain enum values
     assert "role*:" in result
     # Check for enum representation (OPTIONS keyword or pipe-separated values)
-    assert "admin" in result
-    assert "user" in result
-    assert "guest" in result
-
+    assert_contains_all(result, ("admin", "user", "guest"))
+
+
+# (model, substrings its JSONish rendering must contain)
+_ENUM_AND_LITERAL_CASES = [
+    # Integer enum values are listed as one OPTIONS run
+    (IntEnumModel, ("priority*:", "OPTIONS: 1| 2| 3| 4")),
+    # Single literal is rendered as the const value
+    (LiteralSingle, ("api_version*: v1",)),
+    (LiteralUnion, ("status*:", "OPTIONS: draft| published| archived")),
+    # Integer literals are unquoted
+    (IntLiterals, ("priority*:", "OPTIONS: 1| 2| 3| 4| 5")),
+    # Boolean literals are lowercase and unquoted
+    (BoolLiterals, ("flag*:", "OPTIONS: true| false")),
+    (
+        MixedTypeLiterals,
+        (
+            "status*:",
+            "level*:",
+            "enabled*:",
+            "OPTIONS: active| inactive",
+            "OPTIONS: 1| 2| 3",
+            "OPTIONS: true| false",
+        ),
+    ),
+    # Single integer literal is rendered as an unquoted number
+    (SingleConstInt, ("version*: 1",)),
+    (
+        IssueClassification,
+        (
+            "category*: OPTIONS: bug| feature| question",
+            "priority*: OPTIONS: 1| 2| 3| 4| 5",
+        ),
+    ),
+]
 
-def test_jsonish_formatter_with_int_enum():
-    """Test JSONish formatter with integer enum."""
-    from tests.conftest import IntEnumModel
 
-    schema = IntEnumModel.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=False)
-    result = formatter.transform_schema()
-
-    # Should contain priority field
-    assert "priority*:" in result
-    # Check for enum values in output
-    assert "1" in result or "LOW" in result
-
-
-def test_jsonish_formatter_with_literal_single():
-    """Test JSONish formatter with single literal value."""
-    from tests.conftest import LiteralSingle
-
-    schema = LiteralSingle.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=False)
-    result = formatter.transform_schema()
-
-    # Should contain api_version field
-    assert "api_version*:" in result
-    # Single literal should be rendered as the const value
-    assert "v1" in result
-
-
-def test_jsonish_formatter_with_literal_union():
-    """Test JSONish formatter with union of literals."""
-    from tests.conftest import LiteralUnion
-
-    schema = LiteralUnion.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=False)
-    result = formatter.transform_schema()
-
-    # Should contain status field
-    assert "status*:" in result
-    # Should use OPTIONS format for multiple literals
-    assert "OPTIONS:" in result
-    # Should contain all literal values (quoted strings)
-    assert "draft" in result
-    assert "published" in result
-    assert "archived" in result
-
-
-def test_jsonish_formatter_with_int_literals():
-    """Test JSONish formatter with integer literals."""
-    from tests.conftest import IntLiterals
-
-    schema = IntLiterals.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=False)
-    result = formatter.transform_schema()
-
-    # Should contain priority field
-    assert "priority*:" in result
-    # Should use OPTIONS format for multiple integer literals
-    assert "OPTIONS:" in result
-    # Should contain all integer values (unquoted)
-    assert "1" in result
-    assert "2" in result
-    assert "3" in result
-    assert "4" in result
-    assert "5" in result
-    # Verify unquoted format (no quotes around numbers)
-    assert "OPTIONS: 1| 2| 3| 4| 5" in result or "OPTIONS: 1 | 2 | 3 | 4 | 5" in result
-
-
-def test_jsonish_formatter_with_bool_literals():
-    """Test JSONish formatter with boolean literals."""
-    from tests.conftest import BoolLiterals
-
-    schema = BoolLiterals.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=False)
-    result = formatter.transform_schema()
-
-    # Should contain flag field
-    assert "flag*:" in result
-    # Should use OPTIONS format for boolean literals
-    assert "OPTIONS:" in result
-    # Should contain lowercase, unquoted boolean values
-    assert "true" in result
-    assert "false" in result
-
-
-def test_jsonish_formatter_with_mixed_type_literals():
-    """Test JSONish formatter with mixed type literals (string, int, bool)."""
-    from tests.conftest import MixedTypeLiterals
-
-    schema = MixedTypeLiterals.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=False)
-    result = formatter.transform_schema()
-
-    # Should contain all three fields
-    assert "status*:" in result
-    assert "level*:" in result
-    assert "enabled*:" in result
-
-    # String literals should be quoted
-    assert "active" in result
-    assert "inactive" in result
-
-    # Integer literals should be unquoted
-    assert "1" in result and "2" in result and "3" in result
-
-    # Boolean literals should be lowercase and unquoted
-    assert "true" in result
-    assert "false" in result
-
-
-def test_jsonish_formatter_with_single_const_int():
-    """Test JSONish formatter with single integer const."""
-    from tests.conftest import SingleConstInt
-
-    schema = SingleConstInt.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=False)
-    result = formatter.transform_schema()
-
-    # Should contain version field
-    assert "version*:" in result
-    # Single integer literal should be rendered as unquoted number
-    assert "version*: 1" in result
-
-
-def test_jsonish_formatter_with_issue_classification():
-    """Test JSONish formatter with IssueClassification model (integration test)."""
-    from tests.conftest import IssueClassification
-
-    schema = IssueClassification.model_json_schema()
+@pytest.mark.parametrize(
+    ("model_cls", "expected"),
+    _ENUM_AND_LITERAL_CASES,
+    ids=[model_cls.__name__ for model_cls, _ in _ENUM_AND_LITERAL_CASES],
+)
+def test_jsonish_formatter_with_enum_and_literal_values(model_cls, expected):
+    """Test JSONish formatter renders enum, literal and const values for each model."""
+    schema = cached_schema(model_cls)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    # Should contain both fields
-    assert "category*:" in result
-    assert "priority*:" in result
-
-    # String literals should be quoted with OPTIONS format
-    assert "OPTIONS:" in result
-    assert "bug" in result
-    assert "feature" in result
-    assert "question" in result
-
-    # Integer literals should be unquoted with OPTIONS format
-    assert "1" in result
-    assert "2" in result
-    assert "3" in result
-    assert "4" in result
-    assert "5" in result
-
-
-# ============================================================================
-# Array and Collection Tests
-# ============================================================================
+    missing = [s for s in expected if s not in result]
+    assert not missing, f"Expected {missing} in output. Snippet: {result[:250]!r}"
 
 
 def test_jsonish_formatter_with_array_of_strings():
     """Test JSONish formatter with simple array of strings."""
-    from tests.conftest import ArrayOfStrings
-
-    schema = ArrayOfStrings.model_json_schema()
+    schema = cached_schema(ArrayOfStrings)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -466,9 +443,7 @@ def test_jsonish_formatter_with_array_of_strings():
 
 def test_jsonish_formatter_with_array_constraints():
     """Test JSONish formatter with array min/max items constraints."""
-    from tests.conftest import ArrayMinMaxItems
-
-    schema = ArrayMinMaxItems.model_json_schema()
+    schema = cached_schema(ArrayMinMaxItems)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -481,9 +456,7 @@ def test_jsonish_formatter_with_array_constraints():
 
 def test_jsonish_formatter_with_unique_items():
     """Test JSONish formatter with unique items constraint."""
-    from tests.conftest import ArrayUniqueItems
-
-    schema = ArrayUniqueItems.model_json_schema()
+    schema = cached_schema(ArrayUniqueItems)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -495,9 +468,7 @@ def test_jsonish_formatter_with_unique_items():
 
 def test_jsonish_formatter_with_array_of_refs():
     """Test JSONish formatter with array of referenced objects."""
-    from tests.conftest import ArrayOfRefsModel
-
-    schema = ArrayOfRefsModel.model_json_schema()
+    schema = cached_schema(ArrayOfRefsModel)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -516,9 +487,7 @@ def test_jsonish_formatter_with_array_of_refs():
 
 def test_jsonish_formatter_with_deep_nesting():
     """Test JSONish formatter with deeply nested structures (3+ levels)."""
-    from tests.conftest import DeepNested
-
-    schema = DeepNested.model_json_schema()
+    schema = cached_schema(DeepNested)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -531,41 +500,40 @@ def test_jsonish_formatter_with_deep_nesting():
 
 def test_jsonish_formatter_with_union_heavy():
     """Test JSONish formatter with multiple union types."""
-    from tests.conftest import UnionHeavy
-
-    schema = UnionHeavy.model_json_schema()
+    schema = cached_schema(UnionHeavy)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     # Should contain all union fields
-    assert "id*:" in result
-    assert "value*:" in result
-    assert "status*:" in result
-    assert "data*:" in result
+    assert_contains_all(result, ("id*:", "value*:", "status*:", "data*:"))
     # Should show union representation (OR keyword or anyOf)
-    assert "OR" in result or "anyOf" in result.lower() or "|" in result
+    has_or_marker = contains_any(result, ("OR", "|"))
+    assert has_or_marker or contains_any(result, ("anyOf",), case_insensitive=True)
 
 
 def test_jsonish_formatter_with_complex_types():
     """Test JSONish formatter with ComplexTypes model."""
-    from tests.conftest import ComplexTypes
-
-    schema = ComplexTypes.model_json_schema()
+    schema = cached_schema(ComplexTypes)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    # Should contain all primitive fields
-    assert "string_field*:" in result
-    assert "int_field*:" in result
-    assert "float_field*:" in result
-    assert "bool_field:" in result  # has default, might be optional
-    # Should contain arrays
-    assert "string_list:" in result
-    assert "int_list*:" in result
-    # Should contain nested objects
-    assert "address:" in result
-    # Should contain optional fields
-    assert "optional_str:" in result
+    assert_contains_all(
+        result,
+        (
+            # Primitive fields
+            "string_field*:",
+            "int_field*:",
+            "float_field*:",
+            "bool_field:",  # has default, might be optional
+            # Arrays
+            "string_list:",
+            "int_list*:",
+            # Nested objects
+            "address:",
+            # Optional fields
+            "optional_str:",
+        ),
+    )
 
 
 # ============================================================================
@@ -575,9 +543,7 @@ def test_jsonish_formatter_with_complex_types():
 
 def test_jsonish_formatter_with_defaults():
     """Test JSONish formatter with default values."""
-    from tests.conftest import ObjectWithDefaults
-
-    schema = ObjectWithDefaults.model_json_schema()
+    schema = cached_schema(ObjectWithDefaults)
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -592,35 +558,34 @@ def test_jsonish_formatter_with_defaults():
 
 def test_jsonish_formatter_with_field_descriptions():
     """Test JSONish formatter includes field descriptions when metadata enabled."""
-    from tests.conftest import WithFieldDescriptions
-
-    schema = WithFieldDescriptions.model_json_schema()
+    schema = cached_schema(WithFieldDescriptions)
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     # Should contain field names
-    assert "name*:" in result
-    assert "email*:" in result
-    assert "age*:" in result
+    assert_contains_all(result, ("name*:", "email*:", "age*:"))
     # Should contain descriptions as comments
-    assert "full name" in result.lower() or "user's full name" in result.lower()
+    assert contains_any(result, ("full name", "user's full name"), case_insensitive=True)
+
+
+_EXAMPLES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "email": {"type": "string", "examples": ["user@example.com", "admin@example.com"]}
+    },
+    "required": ["email"],
+}
 
 
 def test_jsonish_formatter_with_examples():
     """Test JSONish formatter with example values."""
-    schema = {
-        "type": "object",
-        "properties": {
-            "email": {"type": "string", "examples": ["user@example.com", "admin@example.com"]}
-        },
-        "required": ["email"],
-    }
+    schema = _EXAMPLES_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     # Should include examples when metadata is on
     assert "email*:" in result
-    assert "EXAMPLE" in result or "example" in result.lower()
+    assert contains_any(result, ("EXAMPLE",), case_insensitive=True)
 
 
 # ============================================================================
@@ -630,58 +595,48 @@ def test_jsonish_formatter_with_examples():
 
 def test_jsonish_formatter_with_email_format():
     """Test JSONish formatter with email format constraint."""
-    from tests.conftest import StringFormatEmail
-
-    schema = StringFormatEmail.model_json_schema()
+    schema = cached_schema(StringFormatEmail)
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     # Should contain email field
     assert "email*:" in result
     # Should include format info
-    assert "email" in result.lower()
+    assert "FORMAT: email" in result
 
 
 def test_jsonish_formatter_with_uri_format():
     """Test JSONish formatter with URI format constraint."""
-    from tests.conftest import StringFormatUri
-
-    schema = StringFormatUri.model_json_schema()
+    schema = cached_schema(StringFormatUri)
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     # Should contain website field
     assert "website*:" in result
-    # Should include format or type info
-    assert "string" in result
+    # Should include format info
+    assert "FORMAT: uri" in result
 
 
 def test_jsonish_formatter_with_pattern():
     """Test JSONish formatter with pattern constraint."""
-    from tests.conftest import StringPattern
-
-    schema = StringPattern.model_json_schema()
+    schema = cached_schema(StringPattern)
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     # Should contain code field
     assert "code*:" in result
     # Should include pattern when metadata is on
-    assert "PATTERN" in result or "pattern" in result.lower()
+    assert contains_any(result, ("PATTERN",), case_insensitive=True)
 
 
 def test_jsonish_formatter_with_multiple_patterns():
     """Test JSONish formatter with multiple pattern constraints."""
-    from tests.conftest import PatternConstraints
-
-    schema = PatternConstraints.model_json_schema()
-    formatter = JSONishFormatter(schema, include_metadata=True)
+    schema = cached_schema(PatternConstraints)
+    formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     # Should contain all pattern-constrained fields
-    assert "phone*:" in result
-    assert "zip_code*:" in result
-    assert "username*:" in result
+    assert_contains_all(result, ("phone*:", "zip_code*:", "username*:"))
 
 
 # ============================================================================
@@ -696,9 +651,7 @@ def test_jsonish_formatter_with_exclusive_min_max():
     constraints (from Pydantic gt/lt). This test verifies the model renders without
     crashing. TODO: Consider adding support for exclusive constraints.
     """
-    from tests.conftest import ExclusiveMinMax
-
-    schema = ExclusiveMinMax.model_json_schema()
+    schema = cached_schema(ExclusiveMinMax)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -719,9 +672,7 @@ def test_jsonish_formatter_with_exclusive_min_max():
 
 def test_jsonish_formatter_with_dict_fields():
     """Test JSONish formatter with dict/mapping fields."""
-    from tests.conftest import DictOnlyModel
-
-    schema = DictOnlyModel.model_json_schema()
+    schema = cached_schema(DictOnlyModel)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -734,9 +685,7 @@ def test_jsonish_formatter_with_dict_fields():
 
 def test_jsonish_formatter_with_additional_props_false():
     """Test JSONish formatter with additionalProperties: false."""
-    from tests.conftest import ObjectAdditionalPropsFalse
-
-    schema = ObjectAdditionalPropsFalse.model_json_schema()
+    schema = cached_schema(ObjectAdditionalPropsFalse)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -749,47 +698,55 @@ def test_jsonish_formatter_with_additional_props_false():
     assert "no additional properties" in result or "//no additional properties" in result
 
 
-def test_jsonish_formatter_array_of_objects_not_duplicated():
-    """Regression: array items should render as JSONish, not Python str."""
-    schema = {
-        "type": "object",
-        "properties": {
+_ARRAY_OF_OBJECTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
             "items": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "product_name": {"type": "string"},
-                        "quantity": {"type": "integer"},
-                        "price": {"type": "number"},
-                    },
-                    "required": ["product_name", "quantity", "price"],
+                "type": "object",
+                "properties": {
+                    "product_name": {"type": "string"},
+                    "quantity": {"type": "integer"},
+                    "price": {"type": "number"},
                 },
-            }
-        },
-        "required": ["items"],
-    }
+                "required": ["product_name", "quantity", "price"],
+            },
+        }
+    },
+    "required": ["items"],
+}
+
+
+def test_jsonish_formatter_array_of_objects_not_duplicated():
+    """Regression: array items should render as JSONish, not Python str."""
+    schema = _ARRAY_OF_OBJECTS_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    assert result.count("items*:") == 1
-    assert "items*: [" in result
-    assert "{" in result
-    assert "[{'" not in result
+    # One items field, rendered as an array whose object items open a JSONish block
+    # after it; one forward find per check instead of rescanning the whole output
+    pos = result.find("items*: [")
+    assert pos != -1 and result.count("items*:") == 1, f"Snippet: {result[:300]!r}"
+    assert result.find("{", pos) != -1
+    assert result.find("[{'") == -1
+
+
+_OBJECT_ADDITIONAL_PROPS_SCHEMA = {
+    "type": "object",
+    "properties": {"result": {"type": "object"}},
+    "required": ["result"],
+    "additionalProperties": {
+        "type": "object",
+        "properties": {"value": {"type": "string"}},
+        "required": ["value"],
+    },
+}
 
 
 def test_jsonish_formatter_additional_props_with_object_schema():
     """Regression: additionalProperties object should show structure details."""
-    schema = {
-        "type": "object",
-        "properties": {"result": {"type": "object"}},
-        "required": ["result"],
-        "additionalProperties": {
-            "type": "object",
-            "properties": {"value": {"type": "string"}},
-            "required": ["value"],
-        },
-    }
+    schema = _OBJECT_ADDITIONAL_PROPS_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -798,50 +755,57 @@ def test_jsonish_formatter_additional_props_with_object_schema():
     assert "value* (required): string" in result
 
 
+_EMPTY_PROPERTY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "value": {}  # Empty schema
+    },
+}
+
+
 def test_jsonish_formatter_empty_schema_renders_as_any():
     """Test that empty schema {} renders as 'any', not 'string'."""
-    schema = {
-        "type": "object",
-        "properties": {
-            "value": {}  # Empty schema
-        },
-    }
+    schema = _EMPTY_PROPERTY_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     assert "value: any" in result
 
 
+_COMPLEX_ADDITIONAL_PROPS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "result": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "properties": {"value": {}},
+                "required": ["value"],
+            },
+        }
+    },
+}
+
+
 def test_jsonish_formatter_object_with_complex_additional_props_shows_placeholder():
     """Test that object with only complex additionalProperties shows placeholder key."""
-    schema = {
-        "type": "object",
-        "properties": {
-            "result": {
-                "type": "object",
-                "additionalProperties": {
-                    "type": "object",
-                    "properties": {"value": {}},
-                    "required": ["value"],
-                },
-            }
-        },
-    }
+    schema = _COMPLEX_ADDITIONAL_PROPS_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     # Should show placeholder key with structure
-    assert "<key>" in result
-    assert "value*: any" in result
-    assert "any properties allowed" in result
+    assert_contains_all(result, ("<key>", "value*: any", "any properties allowed"))
+
+
+_SIMPLE_ADDITIONAL_PROPS_SCHEMA = {
+    "type": "object",
+    "properties": {"config": {"type": "object", "additionalProperties": {"type": "string"}}},
+}
 
 
 def test_jsonish_formatter_simple_additional_props_still_work():
     """Test that simple additionalProperties still render as comments."""
-    schema = {
-        "type": "object",
-        "properties": {"config": {"type": "object", "additionalProperties": {"type": "string"}}},
-    }
+    schema = _SIMPLE_ADDITIONAL_PROPS_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -849,9 +813,12 @@ def test_jsonish_formatter_simple_additional_props_still_work():
     assert "additional: string" in result
 
 
+_NO_ADDITIONAL_PROPS_SCHEMA = {"type": "object", "additionalProperties": False}
+
+
 def test_jsonish_formatter_additional_props_false_still_works():
     """Test that additionalProperties: false still works correctly."""
-    schema = {"type": "object", "additionalProperties": False}
+    schema = _NO_ADDITIONAL_PROPS_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -859,24 +826,29 @@ def test_jsonish_formatter_additional_props_false_still_works():
     assert "no additional properties" in result
 
 
+_NESTED_NO_ADDITIONAL_PROPS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "config": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "additionalProperties": False,
+        }
+    },
+    "required": ["config"],
+    "additionalProperties": False,
+}
+
+
 def test_jsonish_formatter_root_additional_props_prefix_only_once():
     """Regression: root prefix should only apply to the first occurrence."""
-    schema = {
-        "type": "object",
-        "properties": {
-            "config": {
-                "type": "object",
-                "properties": {"name": {"type": "string"}},
-                "additionalProperties": False,
-            }
-        },
-        "required": ["config"],
-        "additionalProperties": False,
-    }
+    schema = _NESTED_NO_ADDITIONAL_PROPS_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    assert result.count("Root:") <= 1
+    # At most one occurrence: stop scanning at the second hit
+    first = result.find("Root:")
+    assert first == -1 or result.find("Root:", first + 1) == -1
 
 
 # ============================================================================
@@ -886,9 +858,7 @@ def test_jsonish_formatter_root_additional_props_prefix_only_once():
 
 def test_jsonish_formatter_with_datetime():
     """Test JSONish formatter with datetime fields."""
-    from tests.conftest import EventWithDate
-
-    schema = EventWithDate.model_json_schema()
+    schema = cached_schema(EventWithDate)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -907,18 +877,12 @@ def test_jsonish_formatter_with_datetime():
 
 def test_jsonish_formatter_with_composition():
     """Test JSONish formatter with model composition (allOf-like)."""
-    from tests.conftest import AllOfLike
-
-    schema = AllOfLike.model_json_schema()
+    schema = cached_schema(AllOfLike)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     # Should contain fields from both base classes
-    assert "field_a*:" in result
-    assert "count_a*:" in result
-    assert "field_b*:" in result
-    assert "count_b*:" in result
-    assert "own_field*:" in result
+    assert_contains_all(result, ("field_a*:", "count_a*:", "field_b*:", "count_b*:", "own_field*:"))
 
 
 # ============================================================================
@@ -928,48 +892,40 @@ def test_jsonish_formatter_with_composition():
 
 def test_jsonish_formatter_with_anyof_union():
     """Test JSONish formatter with anyOf at property level."""
-    from tests.conftest import UnionTypes
-
-    schema = UnionTypes.model_json_schema()
+    schema = cached_schema(UnionTypes)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     # Should contain id field which can be int or string
     assert "id*:" in result
     # Should show union/anyOf representation
-    assert "OR" in result or "int" in result or "string" in result
+    assert contains_any(result, ("OR", "int", "string"))
 
 
 def test_jsonish_formatter_with_top_level_anyof():
     """Test JSONish formatter with anyOf at schema root."""
-    from tests.conftest import ANY_OF_SCHEMA
-
     formatter = JSONishFormatter(ANY_OF_SCHEMA, include_metadata=False)
     result = formatter.transform_schema()
 
     # Should handle top-level anyOf
     assert "id" in result
     # Should show OR representation
-    assert "OR" in result or "anyOf" in result.lower()
+    assert "OR" in result or contains_any(result, ("anyOf",), case_insensitive=True)
 
 
 def test_jsonish_formatter_with_top_level_oneof():
     """Test JSONish formatter with oneOf at schema root."""
-    from tests.conftest import ONE_OF_SCHEMA
-
     formatter = JSONishFormatter(ONE_OF_SCHEMA, include_metadata=False)
     result = formatter.transform_schema()
 
     # Should handle top-level oneOf
     assert "type" in result
     # Should show exclusive choice representation
-    assert "ONE OF" in result or "OR" in result
+    assert contains_any(result, ("ONE OF", "OR"))
 
 
 def test_jsonish_formatter_with_top_level_allof():
     """Test JSONish formatter with allOf at schema root."""
-    from tests.conftest import ALL_OF_SCHEMA
-
     formatter = JSONishFormatter(ALL_OF_SCHEMA, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -980,8 +936,6 @@ def test_jsonish_formatter_with_top_level_allof():
 
 def test_jsonish_formatter_with_const():
     """Test JSONish formatter with const keyword."""
-    from tests.conftest import CONST_SCHEMA
-
     formatter = JSONishFormatter(CONST_SCHEMA, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -993,15 +947,11 @@ def test_jsonish_formatter_with_const():
 
 def test_jsonish_formatter_with_dependencies():
     """Test JSONish formatter with schema dependencies."""
-    from tests.conftest import DEPENDENCY_SCHEMA
-
     formatter = JSONishFormatter(DEPENDENCY_SCHEMA, include_metadata=True)
     result = formatter.transform_schema()
 
     # Should contain all fields
-    assert "name:" in result
-    assert "credit_card:" in result
-    assert "billing_address:" in result
+    assert_contains_all(result, ("name:", "credit_card:", "billing_address:"))
     # Should show dependency information when metadata is on
     assert "DEPENDS" in result or result  # At minimum should not crash
 
@@ -1011,9 +961,12 @@ def test_jsonish_formatter_with_dependencies():
 # ============================================================================
 
 
+_EMPTY_PROPERTIES_SCHEMA = {"type": "object", "properties": {}}
+
+
 def test_jsonish_formatter_handles_empty_properties():
     """Edge: schema with properties: {} should handle gracefully."""
-    schema = {"type": "object", "properties": {}}
+    schema = _EMPTY_PROPERTIES_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -1022,9 +975,12 @@ def test_jsonish_formatter_handles_empty_properties():
     assert "}" in result
 
 
+_NULL_TYPE_SCHEMA = {"type": "object", "properties": {"nullable_field": {"type": "null"}}}
+
+
 def test_jsonish_formatter_with_null_type():
     """Edge: field with type: null should handle gracefully."""
-    schema = {"type": "object", "properties": {"nullable_field": {"type": "null"}}}
+    schema = _NULL_TYPE_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -1034,13 +990,16 @@ def test_jsonish_formatter_with_null_type():
     assert "null" in result
 
 
+_TYPE_ARRAY_SCHEMA = {
+    "type": "object",
+    "properties": {"flexible": {"type": ["string", "null"]}},
+    "required": ["flexible"],
+}
+
+
 def test_jsonish_formatter_with_type_array():
     """Edge: field with type as array [string, null] should handle gracefully."""
-    schema = {
-        "type": "object",
-        "properties": {"flexible": {"type": ["string", "null"]}},
-        "required": ["flexible"],
-    }
+    schema = _TYPE_ARRAY_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -1050,34 +1009,33 @@ def test_jsonish_formatter_with_type_array():
     assert "string" in result
 
 
+_ZULU_ALPHA_MIKE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "zulu": {"type": "string"},
+        "alpha": {"type": "integer"},
+        "mike": {"type": "boolean"},
+    },
+    "required": ["zulu", "alpha", "mike"],
+}
+
+
 def test_jsonish_formatter_preserves_property_order():
     """Contract: property order should be preserved from schema dict order."""
-    schema = {
-        "type": "object",
-        "properties": {
-            "zulu": {"type": "string"},
-            "alpha": {"type": "integer"},
-            "mike": {"type": "boolean"},
-        },
-        "required": ["zulu", "alpha", "mike"],
-    }
+    schema = _ZULU_ALPHA_MIKE_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    # Find positions of each field
-    zulu_pos = result.find("zulu*:")
-    alpha_pos = result.find("alpha*:")
-    mike_pos = result.find("mike*:")
+    # Order of each field's first occurrence, from a single pass over the output
+    first_seen = list(dict.fromkeys(m.group(1) for m in _ZULU_ALPHA_MIKE_RE.finditer(result)))
 
     # Verify order is preserved (zulu, alpha, mike)
-    assert zulu_pos < alpha_pos < mike_pos, "Field order should be preserved from schema"
+    assert first_seen == ["zulu", "alpha", "mike"], "Field order should be preserved from schema"
 
 
 def test_jsonish_formatter_with_schema_title():
     """Test that schema-level title appears in output when metadata is on."""
-    from tests.conftest import WithTitleDescription
-
-    schema = WithTitleDescription.model_json_schema()
+    schema = cached_schema(WithTitleDescription)
     formatter = JSONishFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -1087,43 +1045,35 @@ def test_jsonish_formatter_with_schema_title():
 
 def test_jsonish_formatter_with_full_featured_model():
     """Comprehensive test with FullFeaturedModel (kitchen sink)."""
-    from tests.conftest import FullFeaturedModel
-
-    schema = FullFeaturedModel.model_json_schema()
+    schema = cached_schema(FullFeaturedModel)
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    # Should contain various field types
-    assert "name*:" in result
-    assert "age*:" in result
-    assert "score*:" in result
-    assert "role:" in result
-    assert "identifier*:" in result
-    # Should not crash with this complex model
-    assert "{" in result
-    assert "}" in result
+    # Should contain various field types, and not crash with this complex model
+    assert_contains_all(result, ("name*:", "age*:", "score*:", "role:", "identifier*:", "{", "}"))
+
+
+_REQUIRED_AND_OPTIONAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "required_one": {"type": "string"},
+        "required_two": {"type": "integer"},
+        "optional_one": {"type": "string"},
+        "optional_two": {"type": "boolean"},
+    },
+    "required": ["required_one", "required_two"],
+}
 
 
 def test_jsonish_formatter_consistent_asterisk_usage():
     """Regression: asterisks should only appear on required fields."""
-    schema = {
-        "type": "object",
-        "properties": {
-            "required_one": {"type": "string"},
-            "required_two": {"type": "integer"},
-            "optional_one": {"type": "string"},
-            "optional_two": {"type": "boolean"},
-        },
-        "required": ["required_one", "required_two"],
-    }
+    schema = _REQUIRED_AND_OPTIONAL_SCHEMA
     formatter = JSONishFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
-    # Required fields should have asterisk
-    assert "required_one*:" in result
-    assert "required_two*:" in result
-    # Optional fields should NOT have asterisk
-    assert "optional_one:" in result
+    # Required fields should have asterisk, optional fields should be listed without one
+    assert_contains_all(
+        result, ("required_one*:", "required_two*:", "optional_one:", "optional_two:")
+    )
     assert "optional_one*:" not in result
-    assert "optional_two:" in result
     assert "optional_two*:" not in result
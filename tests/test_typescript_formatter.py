@@ -12,6 +12,7 @@ from tests.conftest import (
     ANY_OF_SCHEMA,
     CONST_SCHEMA,
     DEPENDENCY_SCHEMA,
+    DEPRECATED_EXAMPLES_SCHEMA,
     EMPTY_SCHEMA,
     ONE_OF_SCHEMA,
     AllOfLike,
@@ -19,6 +20,7 @@ from tests.conftest import (
     ArrayOfRefsModel,
     ArrayOfStrings,
     ArrayUniqueItems,
+    BoolLiterals,
     ConstrainedFormatterModel,
     DeepNested,
     DictOnlyModel,
@@ -26,8 +28,11 @@ from tests.conftest import (
     ExclusiveMinMax,
     FullFeaturedModel,
     IntEnumModel,
+    IntLiterals,
+    IssueClassification,
     LiteralSingle,
     LiteralUnion,
+    MixedTypeLiterals,
     ObjectAdditionalPropsFalse,
     ObjectRequiredOnly,
     ObjectWithDefaults,
@@ -35,8 +40,9 @@ from tests.conftest import (
     PatternConstraints,
     PersonWithAddress,
     RequiredOptionalModel,
-    Role,
     SimpleFormatterModel,
+    SingleConstInt,
+    StringEnumModel,
     StringFormatEmail,
     StringFormatUri,
     StringPattern,
@@ -44,21 +50,27 @@ from tests.conftest import (
     UnionTypes,
     WithFieldDescriptions,
     WithTitleDescription,
+    cached_schema,
+    wide_object_schema,
 )
 from tests.formatter_helpers import (
+    assert_contains_all,
     assert_required_optional_consistent,
     assert_required_optional_fields_match_schema,
     assert_schema_title_comment_consistent,
     parse_typescript_interface_fields,
+    schema_field_sets,
 )
 
 # Alias for backwards compatibility in tests
 SimpleModel = SimpleFormatterModel
 
+_SCORE_RANGE_RE = re.compile(r"score\*:\s*number\s*\(0(\.0)?-100(\.0)?\)")
+
 
 def test_typescript_formatter_produces_valid_output():
     """Test that TypeScript formatter produces valid output with required fields marked."""
-    schema = SimpleModel.model_json_schema()
+    schema = cached_schema(SimpleModel)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -81,7 +93,7 @@ def test_typescript_formatter_produces_valid_output():
 
 def test_typescript_formatter_without_metadata():
     """Test TypeScript formatter without metadata."""
-    schema = SimpleModel.model_json_schema()
+    schema = cached_schema(SimpleModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -99,7 +111,7 @@ def test_typescript_formatter_without_metadata():
 
 def test_typescript_formatter_with_nested_defs():
     """Test TypeScript formatter with nested $defs."""
-    schema = PersonWithAddress.model_json_schema()
+    schema = cached_schema(PersonWithAddress)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -120,7 +132,7 @@ def test_typescript_formatter_with_nested_defs():
 
 def test_typescript_formatter_key_order_preserved():
     """Test that TypeScript formatter preserves key order (dict order)."""
-    schema = OrderedFieldsModel.model_json_schema()
+    schema = cached_schema(OrderedFieldsModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -131,7 +143,7 @@ def test_typescript_formatter_key_order_preserved():
 
 def test_typescript_formatter_caching():
     """Test that formatter caching works correctly."""
-    schema = SimpleModel.model_json_schema()
+    schema = cached_schema(SimpleModel)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
 
     result1 = formatter.transform_schema()
@@ -144,7 +156,7 @@ def test_typescript_formatter_caching():
 
 def test_typescript_formatter_with_constraints():
     """Test that TypeScript formatter includes field constraints when metadata enabled."""
-    schema = ConstrainedFormatterModel.model_json_schema()
+    schema = cached_schema(ConstrainedFormatterModel)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -156,14 +168,14 @@ def test_typescript_formatter_with_constraints():
     # Constraints appear inline in the type when include_metadata=True
     assert "name*: string (1-100 chars)" in result
     assert "age*: number (0-150)" in result
-    assert re.search(
-        r"score\*:\s*number\s*\(0(\.0)?-100(\.0)?\)", result
-    ), f"Expected score range constraint in output. Snippet: {result[:350]!r}"
+    assert _SCORE_RANGE_RE.search(result), (
+        f"Expected score range constraint in output. Snippet: {result[:350]!r}"
+    )
 
 
 def test_typescript_formatter_with_optional_union():
     """Test that TypeScript formatter handles optional fields (union with None)."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = cached_schema(RequiredOptionalModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -187,7 +199,7 @@ def test_typescript_formatter_with_optional_union():
 )
 def test_typescript_contract_root_fields_match_schema(model_cls):
     """Contract: root interface fields match schema required/properties."""
-    schema = model_cls.model_json_schema()
+    schema = cached_schema(model_cls)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -202,7 +214,7 @@ def test_typescript_contract_root_fields_match_schema(model_cls):
 
 def test_typescript_required_optional_parsing_matches_schema():
     """Test that parsed TypeScript interface fields match schema required/properties."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = cached_schema(RequiredOptionalModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -221,13 +233,13 @@ def test_typescript_required_optional_parsing_matches_schema():
 )
 def test_typescript_lists_all_root_properties_for_models(model_cls):
     """Contract: TypeScript output lists all root properties from schema."""
-    schema = model_cls.model_json_schema()
+    schema = cached_schema(model_cls)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     fields = parse_typescript_interface_fields(result, interface_name="Schema")
     field_names = {name for name, _ in fields}
-    properties_in_schema = set((schema.get("properties", {}) or {}).keys())
+    _, properties_in_schema = schema_field_sets(schema)
 
     missing_props = properties_in_schema - field_names
     assert not missing_props, f"Missing properties in output: {sorted(missing_props)}"
@@ -244,7 +256,7 @@ def test_typescript_lists_all_root_properties_for_models(model_cls):
 )
 def test_typescript_required_optional_consistent_for_models(model_cls):
     """Contract: required fields have '*' and optional do not."""
-    schema = model_cls.model_json_schema()
+    schema = cached_schema(model_cls)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -269,7 +281,7 @@ def test_typescript_empty_object_schema():
 
 def test_typescript_single_required_field():
     """Test TypeScript formatter with single required field."""
-    schema = ObjectRequiredOnly.model_json_schema()
+    schema = cached_schema(ObjectRequiredOnly)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -281,7 +293,7 @@ def test_typescript_single_required_field():
 
 def test_typescript_all_optional_no_asterisks():
     """Test TypeScript formatter with all optional fields has no asterisks."""
-    schema = ObjectWithDefaults.model_json_schema()
+    schema = cached_schema(ObjectWithDefaults)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -307,7 +319,7 @@ def test_typescript_empty_properties():
 
 def test_typescript_schema_title_when_metadata_on():
     """Test TypeScript formatter includes schema title comment when metadata is on."""
-    schema = WithTitleDescription.model_json_schema()
+    schema = cached_schema(WithTitleDescription)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -321,7 +333,7 @@ def test_typescript_schema_title_when_metadata_on():
 
 def test_typescript_format_scaffolding():
     """Test that TypeScript output has expected top-level structure."""
-    schema = SimpleFormatterModel.model_json_schema()
+    schema = cached_schema(SimpleFormatterModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -338,13 +350,7 @@ def test_typescript_format_scaffolding():
 
 def test_typescript_string_enum():
     """Test TypeScript formatter with string enum (Role)."""
-    # Build model with Role enum
-    from pydantic import BaseModel
-
-    class ModelWithRole(BaseModel):
-        role: Role
-
-    schema = ModelWithRole.model_json_schema()
+    schema = cached_schema(StringEnumModel)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -354,7 +360,7 @@ def test_typescript_string_enum():
 
 def test_typescript_int_enum():
     """Test TypeScript formatter with integer enum."""
-    schema = IntEnumModel.model_json_schema()
+    schema = cached_schema(IntEnumModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -364,7 +370,7 @@ def test_typescript_int_enum():
 
 def test_typescript_literal_single():
     """Test TypeScript formatter with single literal value."""
-    schema = LiteralSingle.model_json_schema()
+    schema = cached_schema(LiteralSingle)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -376,24 +382,19 @@ def test_typescript_literal_single():
 
 def test_typescript_literal_union():
     """Test TypeScript formatter with union of literals."""
-    schema = LiteralUnion.model_json_schema()
+    schema = cached_schema(LiteralUnion)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     assert_required_optional_consistent(result, schema)
     assert "status*:" in result
     # Should use pipe-separated union format for literals
-    assert "draft" in result
-    assert "published" in result
-    assert "archived" in result
-    assert "|" in result
+    assert_contains_all(result, ("draft", "published", "archived", "|"))
 
 
 def test_typescript_int_literals():
     """Test TypeScript formatter with integer literals."""
-    from tests.conftest import IntLiterals
-
-    schema = IntLiterals.model_json_schema()
+    schema = cached_schema(IntLiterals)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -405,9 +406,7 @@ def test_typescript_int_literals():
 
 def test_typescript_bool_literals():
     """Test TypeScript formatter with boolean literals."""
-    from tests.conftest import BoolLiterals
-
-    schema = BoolLiterals.model_json_schema()
+    schema = cached_schema(BoolLiterals)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -419,17 +418,13 @@ def test_typescript_bool_literals():
 
 def test_typescript_mixed_type_literals():
     """Test TypeScript formatter with mixed type literals (string, int, bool)."""
-    from tests.conftest import MixedTypeLiterals
-
-    schema = MixedTypeLiterals.model_json_schema()
+    schema = cached_schema(MixedTypeLiterals)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     assert_required_optional_consistent(result, schema)
     # Should contain all three fields
-    assert "status*:" in result
-    assert "level*:" in result
-    assert "enabled*:" in result
+    assert_contains_all(result, ("status*:", "level*:", "enabled*:"))
 
     # String literals should be quoted
     assert "active" in result
@@ -444,9 +439,7 @@ def test_typescript_mixed_type_literals():
 
 def test_typescript_single_const_int():
     """Test TypeScript formatter with single integer const."""
-    from tests.conftest import SingleConstInt
-
-    schema = SingleConstInt.model_json_schema()
+    schema = cached_schema(SingleConstInt)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -458,9 +451,7 @@ def test_typescript_single_const_int():
 
 def test_typescript_issue_classification():
     """Test TypeScript formatter with IssueClassification model (integration test)."""
-    from tests.conftest import IssueClassification
-
-    schema = IssueClassification.model_json_schema()
+    schema = cached_schema(IssueClassification)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -470,9 +461,7 @@ def test_typescript_issue_classification():
     assert "priority*:" in result
 
     # String literals should be quoted with pipe unions
-    assert "bug" in result
-    assert "feature" in result
-    assert "question" in result
+    assert_contains_all(result, ("bug", "feature", "question"))
 
     # Integer literals should be unquoted with pipe unions
     assert "1 | 2 | 3 | 4 | 5" in result
@@ -485,7 +474,7 @@ def test_typescript_issue_classification():
 
 def test_typescript_array_of_strings():
     """Test TypeScript formatter with array of strings."""
-    schema = ArrayOfStrings.model_json_schema()
+    schema = cached_schema(ArrayOfStrings)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -497,7 +486,7 @@ def test_typescript_array_of_strings():
 
 def test_typescript_array_constraints():
     """Test TypeScript formatter with array min/max items constraints."""
-    schema = ArrayMinMaxItems.model_json_schema()
+    schema = cached_schema(ArrayMinMaxItems)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -507,7 +496,7 @@ def test_typescript_array_constraints():
 
 def test_typescript_unique_items():
     """Test TypeScript formatter with unique items constraint."""
-    schema = ArrayUniqueItems.model_json_schema()
+    schema = cached_schema(ArrayUniqueItems)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -520,7 +509,7 @@ def test_typescript_unique_items():
 
 def test_typescript_array_of_refs():
     """Test TypeScript formatter with array of referenced objects."""
-    schema = ArrayOfRefsModel.model_json_schema()
+    schema = cached_schema(ArrayOfRefsModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -537,7 +526,7 @@ def test_typescript_array_of_refs():
 
 def test_typescript_deep_nesting():
     """Test TypeScript formatter with deep nesting (A -> B -> C)."""
-    schema = DeepNested.model_json_schema()
+    schema = cached_schema(DeepNested)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -549,7 +538,7 @@ def test_typescript_deep_nesting():
 
 def test_typescript_union_heavy():
     """Test TypeScript formatter with multiple union types."""
-    schema = UnionHeavy.model_json_schema()
+    schema = cached_schema(UnionHeavy)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -563,7 +552,7 @@ def test_typescript_union_heavy():
 
 def test_typescript_complex_types():
     """Test TypeScript formatter with complex field types."""
-    schema = UnionTypes.model_json_schema()
+    schema = cached_schema(UnionTypes)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -580,7 +569,7 @@ def test_typescript_complex_types():
 
 def test_typescript_defaults():
     """Test TypeScript formatter with default values."""
-    schema = ObjectWithDefaults.model_json_schema()
+    schema = cached_schema(ObjectWithDefaults)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -596,22 +585,18 @@ def test_typescript_defaults():
 
 def test_typescript_field_descriptions():
     """Test TypeScript formatter with field descriptions."""
-    schema = WithFieldDescriptions.model_json_schema()
+    schema = cached_schema(WithFieldDescriptions)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     assert_required_optional_consistent(result, schema)
     # When metadata is on, descriptions may appear as comments
     # At minimum, fields should be present
-    assert "name*:" in result
-    assert "email*:" in result
-    assert "age*:" in result
+    assert_contains_all(result, ("name*:", "email*:", "age*:"))
 
 
 def test_typescript_examples():
     """Test TypeScript formatter with examples in schema."""
-    from tests.conftest import DEPRECATED_EXAMPLES_SCHEMA
-
     schema = DEPRECATED_EXAMPLES_SCHEMA
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
@@ -627,7 +612,7 @@ def test_typescript_examples():
 
 def test_typescript_string_format_email():
     """Test TypeScript formatter with email format."""
-    schema = StringFormatEmail.model_json_schema()
+    schema = cached_schema(StringFormatEmail)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -637,7 +622,7 @@ def test_typescript_string_format_email():
 
 def test_typescript_string_format_uri():
     """Test TypeScript formatter with URI format."""
-    schema = StringFormatUri.model_json_schema()
+    schema = cached_schema(StringFormatUri)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -647,7 +632,7 @@ def test_typescript_string_format_uri():
 
 def test_typescript_string_pattern():
     """Test TypeScript formatter with pattern constraint."""
-    schema = StringPattern.model_json_schema()
+    schema = cached_schema(StringPattern)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -657,15 +642,13 @@ def test_typescript_string_pattern():
 
 def test_typescript_multiple_patterns():
     """Test TypeScript formatter with multiple pattern constraints."""
-    schema = PatternConstraints.model_json_schema()
+    schema = cached_schema(PatternConstraints)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     assert_required_optional_consistent(result, schema)
     # All fields have patterns
-    assert "phone*:" in result
-    assert "zip_code*:" in result
-    assert "username*:" in result
+    assert_contains_all(result, ("phone*:", "zip_code*:", "username*:"))
 
 
 # ============================================================================
@@ -675,7 +658,7 @@ def test_typescript_multiple_patterns():
 
 def test_typescript_exclusive_min_max():
     """Test TypeScript formatter with exclusive minimum/maximum (gt/lt)."""
-    schema = ExclusiveMinMax.model_json_schema()
+    schema = cached_schema(ExclusiveMinMax)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -692,7 +675,7 @@ def test_typescript_exclusive_min_max():
 
 def test_typescript_dict_fields():
     """Test TypeScript formatter with dict fields."""
-    schema = DictOnlyModel.model_json_schema()
+    schema = cached_schema(DictOnlyModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -702,7 +685,7 @@ def test_typescript_dict_fields():
 
 def test_typescript_additional_properties_false():
     """Test TypeScript formatter with additionalProperties: false."""
-    schema = ObjectAdditionalPropsFalse.model_json_schema()
+    schema = cached_schema(ObjectAdditionalPropsFalse)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -721,7 +704,7 @@ def test_typescript_additional_properties_false():
 
 def test_typescript_datetime_fields():
     """Test TypeScript formatter with datetime fields."""
-    schema = EventWithDate.model_json_schema()
+    schema = cached_schema(EventWithDate)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -738,7 +721,7 @@ def test_typescript_datetime_fields():
 
 def test_typescript_allof_like():
     """Test TypeScript formatter with allOf-like composition."""
-    schema = AllOfLike.model_json_schema()
+    schema = cached_schema(AllOfLike)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -757,7 +740,7 @@ def test_typescript_allof_like():
 
 def test_typescript_anyof_property_level():
     """Test TypeScript formatter with anyOf at property level."""
-    schema = UnionTypes.model_json_schema()
+    schema = cached_schema(UnionTypes)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -836,7 +819,7 @@ def test_typescript_dependencies():
 
 def test_typescript_null_type():
     """Test TypeScript formatter with null type (optional fields)."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = cached_schema(RequiredOptionalModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -863,7 +846,7 @@ def test_typescript_type_array():
 
 def test_typescript_property_order_preservation():
     """Test that TypeScript formatter preserves property order."""
-    schema = OrderedFieldsModel.model_json_schema()
+    schema = cached_schema(OrderedFieldsModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -872,9 +855,19 @@ def test_typescript_property_order_preservation():
     assert names == ["first", "second", "third"], f"Unexpected field order: {names}"
 
 
+def test_typescript_wide_schema_lists_all_fields():
+    """Test TypeScript formatter renders every field of a 100-field schema in order."""
+    schema = wide_object_schema()
+    formatter = TypeScriptFormatter(schema, include_metadata=False)
+    result = formatter.transform_schema()
+
+    names = [n for n, _ in parse_typescript_interface_fields(result, interface_name="Schema")]
+    assert names == list(schema["properties"])
+
+
 def test_typescript_full_featured_model():
     """Test TypeScript formatter with kitchen sink model."""
-    schema = FullFeaturedModel.model_json_schema()
+    schema = cached_schema(FullFeaturedModel)
     formatter = TypeScriptFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -886,7 +879,7 @@ def test_typescript_full_featured_model():
 
 def test_typescript_consistent_asterisk_usage():
     """Test that asterisk usage is consistent across formatter."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = cached_schema(RequiredOptionalModel)
     formatter = TypeScriptFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -1,5 +1,6 @@
 """Tests for JSON and YAML validators (Draft202012Validator, FormatChecker)."""
 
+import pytest
 from pydantic import BaseModel
 
 from llm_schema_lite import validate
@@ -13,6 +14,7 @@ class User(BaseModel):
     age: int
 
 
+@pytest.mark.yaml
 class TestYAMLValidator:
     """Confirm YAMLValidator uses Draft202012Validator and FormatChecker with YAML."""
 
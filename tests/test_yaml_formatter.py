@@ -11,6 +11,7 @@ from tests.conftest import (
     ANY_OF_SCHEMA,
     CONST_SCHEMA,
     DEPENDENCY_SCHEMA,
+    DEPRECATED_EXAMPLES_SCHEMA,
     EMPTY_SCHEMA,
     ONE_OF_SCHEMA,
     AllOfLike,
@@ -18,6 +19,7 @@ from tests.conftest import (
     ArrayOfRefsModel,
     ArrayOfStrings,
     ArrayUniqueItems,
+    BoolLiterals,
     ConstrainedFormatterModel,
     DeepNested,
     DictOnlyModel,
@@ -25,8 +27,11 @@ from tests.conftest import (
     ExclusiveMinMax,
     FullFeaturedModel,
     IntEnumModel,
+    IntLiterals,
+    IssueClassification,
     LiteralSingle,
     LiteralUnion,
+    MixedTypeLiterals,
     ObjectAdditionalPropsFalse,
     ObjectRequiredOnly,
     ObjectWithDefaults,
@@ -34,8 +39,9 @@ from tests.conftest import (
     PatternConstraints,
     PersonWithAddress,
     RequiredOptionalModel,
-    Role,
     SimpleFormatterModel,
+    SingleConstInt,
+    StringEnumModel,
     StringFormatEmail,
     StringFormatUri,
     StringPattern,
@@ -43,21 +49,27 @@ from tests.conftest import (
     UnionTypes,
     WithFieldDescriptions,
     WithTitleDescription,
+    cached_schema,
+    wide_object_schema,
 )
 from tests.formatter_helpers import (
+    assert_contains_all,
     assert_required_optional_consistent,
     assert_required_optional_fields_match_schema,
     assert_schema_title_comment_consistent,
     parse_yaml_root_fields,
+    schema_field_sets,
 )
 
 # Alias for backwards compatibility in tests
 SimpleModel = SimpleFormatterModel
 
+pytestmark = pytest.mark.yaml
+
 
 def test_yaml_formatter_produces_valid_yaml():
     """Test that YAML formatter produces valid YAML that can be parsed."""
-    schema = SimpleModel.model_json_schema()
+    schema = cached_schema(SimpleModel)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -75,7 +87,7 @@ def test_yaml_formatter_produces_valid_yaml():
 
 def test_yaml_formatter_without_metadata():
     """Test YAML formatter without metadata."""
-    schema = SimpleModel.model_json_schema()
+    schema = cached_schema(SimpleModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -92,7 +104,7 @@ def test_yaml_formatter_without_metadata():
 
 def test_yaml_formatter_with_nested_defs():
     """Test YAML formatter with nested $defs."""
-    schema = PersonWithAddress.model_json_schema()
+    schema = cached_schema(PersonWithAddress)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -126,7 +138,7 @@ def test_yaml_formatter_with_nested_defs():
 
 def test_yaml_formatter_key_order_preserved():
     """Test that YAML formatter preserves key order (dict order)."""
-    schema = OrderedFieldsModel.model_json_schema()
+    schema = cached_schema(OrderedFieldsModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -137,7 +149,7 @@ def test_yaml_formatter_key_order_preserved():
 
 def test_yaml_formatter_caching():
     """Test that formatter caching works correctly."""
-    schema = SimpleModel.model_json_schema()
+    schema = cached_schema(SimpleModel)
     formatter = YAMLFormatter(schema, include_metadata=True)
 
     # First call
@@ -157,7 +169,7 @@ def test_yaml_formatter_caching():
 
 def test_yaml_required_optional_parsing_matches_schema():
     """Test that parsed YAML root fields match schema required/properties."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = cached_schema(RequiredOptionalModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -176,13 +188,13 @@ def test_yaml_required_optional_parsing_matches_schema():
 )
 def test_yaml_lists_all_root_properties_for_models(model_cls):
     """Contract: YAML output lists all root properties from schema."""
-    schema = model_cls.model_json_schema()
+    schema = cached_schema(model_cls)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     fields = parse_yaml_root_fields(result)
     field_names = {name for name, _ in fields}
-    properties_in_schema = set((schema.get("properties", {}) or {}).keys())
+    _, properties_in_schema = schema_field_sets(schema)
 
     missing_props = properties_in_schema - field_names
     assert not missing_props, f"Missing properties in output: {sorted(missing_props)}"
@@ -199,7 +211,7 @@ def test_yaml_lists_all_root_properties_for_models(model_cls):
 )
 def test_yaml_required_optional_consistent_for_models(model_cls):
     """Contract: required fields have '*' and optional do not."""
-    schema = model_cls.model_json_schema()
+    schema = cached_schema(model_cls)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -224,7 +236,7 @@ def test_yaml_empty_object_schema():
 
 def test_yaml_single_required_field():
     """Test YAML formatter with single required field."""
-    schema = ObjectRequiredOnly.model_json_schema()
+    schema = cached_schema(ObjectRequiredOnly)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -236,7 +248,7 @@ def test_yaml_single_required_field():
 
 def test_yaml_all_optional_no_asterisks():
     """Test YAML formatter with all optional fields has no asterisks."""
-    schema = ObjectWithDefaults.model_json_schema()
+    schema = cached_schema(ObjectWithDefaults)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -261,7 +273,7 @@ def test_yaml_empty_properties():
 
 def test_yaml_schema_title_when_metadata_on():
     """Test YAML formatter includes schema title comment when metadata is on."""
-    schema = WithTitleDescription.model_json_schema()
+    schema = cached_schema(WithTitleDescription)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -275,7 +287,7 @@ def test_yaml_schema_title_when_metadata_on():
 
 def test_yaml_format_scaffolding():
     """Test that YAML output has expected top-level structure."""
-    schema = SimpleFormatterModel.model_json_schema()
+    schema = cached_schema(SimpleFormatterModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -283,7 +295,7 @@ def test_yaml_format_scaffolding():
     parsed = yaml.safe_load(result)
     assert isinstance(parsed, dict)
     # Should have expected keys from schema
-    properties = set((schema.get("properties", {}) or {}).keys())
+    _, properties = schema_field_sets(schema)
     assert properties, "Expected schema to have properties"
 
 
@@ -294,13 +306,7 @@ def test_yaml_format_scaffolding():
 
 def test_yaml_string_enum():
     """Test YAML formatter with string enum (Role)."""
-    # Build model with Role enum
-    from pydantic import BaseModel
-
-    class ModelWithRole(BaseModel):
-        role: Role
-
-    schema = ModelWithRole.model_json_schema()
+    schema = cached_schema(StringEnumModel)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -314,7 +320,7 @@ def test_yaml_string_enum():
 
 def test_yaml_int_enum():
     """Test YAML formatter with integer enum."""
-    schema = IntEnumModel.model_json_schema()
+    schema = cached_schema(IntEnumModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -324,7 +330,7 @@ def test_yaml_int_enum():
 
 def test_yaml_literal_single():
     """Test YAML formatter with single literal value."""
-    schema = LiteralSingle.model_json_schema()
+    schema = cached_schema(LiteralSingle)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -336,7 +342,7 @@ def test_yaml_literal_single():
 
 def test_yaml_literal_union():
     """Test YAML formatter with union of literals."""
-    schema = LiteralUnion.model_json_schema()
+    schema = cached_schema(LiteralUnion)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -345,16 +351,12 @@ def test_yaml_literal_union():
     # Should use OPTIONS format for multiple literals
     assert "OPTIONS:" in result
     # Should contain all literal values (YAML wraps entire OPTIONS string in quotes)
-    assert "draft" in result
-    assert "published" in result
-    assert "archived" in result
+    assert_contains_all(result, ("draft", "published", "archived"))
 
 
 def test_yaml_int_literals():
     """Test YAML formatter with integer literals."""
-    from tests.conftest import IntLiterals
-
-    schema = IntLiterals.model_json_schema()
+    schema = cached_schema(IntLiterals)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -363,20 +365,14 @@ def test_yaml_int_literals():
     # Should use OPTIONS format for multiple integer literals
     assert "OPTIONS:" in result
     # Should contain all integer values (unquoted)
-    assert "1" in result
-    assert "2" in result
-    assert "3" in result
-    assert "4" in result
-    assert "5" in result
+    assert_contains_all(result, ("1", "2", "3", "4", "5"))
     # Verify unquoted format
     assert "OPTIONS: 1| 2| 3| 4| 5" in result or "OPTIONS: 1 | 2 | 3 | 4 | 5" in result
 
 
 def test_yaml_bool_literals():
     """Test YAML formatter with boolean literals."""
-    from tests.conftest import BoolLiterals
-
-    schema = BoolLiterals.model_json_schema()
+    schema = cached_schema(BoolLiterals)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -385,24 +381,19 @@ def test_yaml_bool_literals():
     # Should use OPTIONS format for boolean literals
     assert "OPTIONS:" in result
     # YAML may serialize bools as True/False (Python) - verify presence
-    has_true = "true" in result.lower() or "True" in result
-    has_false = "false" in result.lower() or "False" in result
-    assert has_true and has_false
+    low = result.lower()
+    assert "true" in low and "false" in low
 
 
 def test_yaml_mixed_type_literals():
     """Test YAML formatter with mixed type literals (string, int, bool)."""
-    from tests.conftest import MixedTypeLiterals
-
-    schema = MixedTypeLiterals.model_json_schema()
+    schema = cached_schema(MixedTypeLiterals)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
     assert_required_optional_consistent(result, schema)
     # Should contain all three fields
-    assert "status*:" in result
-    assert "level*:" in result
-    assert "enabled*:" in result
+    assert_contains_all(result, ("status*:", "level*:", "enabled*:"))
 
     # String literals (YAML wraps entire OPTIONS string in quotes)
     assert "active" in result
@@ -412,16 +403,13 @@ def test_yaml_mixed_type_literals():
     assert "1" in result and "2" in result and "3" in result
 
     # Boolean literals (YAML may use True/False)
-    has_true = "true" in result.lower() or "True" in result
-    has_false = "false" in result.lower() or "False" in result
-    assert has_true and has_false
+    low = result.lower()
+    assert "true" in low and "false" in low
 
 
 def test_yaml_single_const_int():
     """Test YAML formatter with single integer const."""
-    from tests.conftest import SingleConstInt
-
-    schema = SingleConstInt.model_json_schema()
+    schema = cached_schema(SingleConstInt)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -433,9 +421,7 @@ def test_yaml_single_const_int():
 
 def test_yaml_issue_classification():
     """Test YAML formatter with IssueClassification model (integration test)."""
-    from tests.conftest import IssueClassification
-
-    schema = IssueClassification.model_json_schema()
+    schema = cached_schema(IssueClassification)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -445,17 +431,10 @@ def test_yaml_issue_classification():
     assert "priority*:" in result
 
     # String literals with OPTIONS format (YAML wraps entire string)
-    assert "OPTIONS:" in result
-    assert "bug" in result
-    assert "feature" in result
-    assert "question" in result
+    assert_contains_all(result, ("OPTIONS:", "bug", "feature", "question"))
 
     # Integer literals with OPTIONS format
-    assert "1" in result
-    assert "2" in result
-    assert "3" in result
-    assert "4" in result
-    assert "5" in result
+    assert_contains_all(result, ("1", "2", "3", "4", "5"))
 
 
 # ============================================================================
@@ -465,7 +444,7 @@ def test_yaml_issue_classification():
 
 def test_yaml_array_of_strings():
     """Test YAML formatter with array of strings."""
-    schema = ArrayOfStrings.model_json_schema()
+    schema = cached_schema(ArrayOfStrings)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -477,7 +456,7 @@ def test_yaml_array_of_strings():
 
 def test_yaml_array_constraints():
     """Test YAML formatter with array min/max items constraints."""
-    schema = ArrayMinMaxItems.model_json_schema()
+    schema = cached_schema(ArrayMinMaxItems)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -489,7 +468,7 @@ def test_yaml_array_constraints():
 
 def test_yaml_unique_items():
     """Test YAML formatter with unique items constraint."""
-    schema = ArrayUniqueItems.model_json_schema()
+    schema = cached_schema(ArrayUniqueItems)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -502,7 +481,7 @@ def test_yaml_unique_items():
 
 def test_yaml_array_of_refs():
     """Test YAML formatter with array of referenced objects."""
-    schema = ArrayOfRefsModel.model_json_schema()
+    schema = cached_schema(ArrayOfRefsModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -519,7 +498,7 @@ def test_yaml_array_of_refs():
 
 def test_yaml_deep_nesting():
     """Test YAML formatter with deep nesting (A -> B -> C)."""
-    schema = DeepNested.model_json_schema()
+    schema = cached_schema(DeepNested)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -531,7 +510,7 @@ def test_yaml_deep_nesting():
 
 def test_yaml_union_heavy():
     """Test YAML formatter with multiple union types."""
-    schema = UnionHeavy.model_json_schema()
+    schema = cached_schema(UnionHeavy)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -545,7 +524,7 @@ def test_yaml_union_heavy():
 
 def test_yaml_complex_types():
     """Test YAML formatter with complex field types."""
-    schema = UnionTypes.model_json_schema()
+    schema = cached_schema(UnionTypes)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -562,7 +541,7 @@ def test_yaml_complex_types():
 
 def test_yaml_defaults():
     """Test YAML formatter with default values."""
-    schema = ObjectWithDefaults.model_json_schema()
+    schema = cached_schema(ObjectWithDefaults)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -578,22 +557,18 @@ def test_yaml_defaults():
 
 def test_yaml_field_descriptions():
     """Test YAML formatter with field descriptions."""
-    schema = WithFieldDescriptions.model_json_schema()
+    schema = cached_schema(WithFieldDescriptions)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     assert_required_optional_consistent(result, schema)
     # When metadata is on, descriptions may appear as comments
     # At minimum, fields should be present
-    assert "name*:" in result
-    assert "email*:" in result
-    assert "age*:" in result
+    assert_contains_all(result, ("name*:", "email*:", "age*:"))
 
 
 def test_yaml_examples():
     """Test YAML formatter with examples in schema."""
-    from tests.conftest import DEPRECATED_EXAMPLES_SCHEMA
-
     schema = DEPRECATED_EXAMPLES_SCHEMA
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
@@ -610,7 +585,7 @@ def test_yaml_examples():
 
 def test_yaml_string_format_email():
     """Test YAML formatter with email format."""
-    schema = StringFormatEmail.model_json_schema()
+    schema = cached_schema(StringFormatEmail)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -620,7 +595,7 @@ def test_yaml_string_format_email():
 
 def test_yaml_string_format_uri():
     """Test YAML formatter with URI format."""
-    schema = StringFormatUri.model_json_schema()
+    schema = cached_schema(StringFormatUri)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -630,7 +605,7 @@ def test_yaml_string_format_uri():
 
 def test_yaml_string_pattern():
     """Test YAML formatter with pattern constraint."""
-    schema = StringPattern.model_json_schema()
+    schema = cached_schema(StringPattern)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -640,15 +615,13 @@ def test_yaml_string_pattern():
 
 def test_yaml_multiple_patterns():
     """Test YAML formatter with multiple pattern constraints."""
-    schema = PatternConstraints.model_json_schema()
+    schema = cached_schema(PatternConstraints)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
     assert_required_optional_consistent(result, schema)
     # All fields have patterns
-    assert "phone*:" in result
-    assert "zip_code*:" in result
-    assert "username*:" in result
+    assert_contains_all(result, ("phone*:", "zip_code*:", "username*:"))
 
 
 # ============================================================================
@@ -658,7 +631,7 @@ def test_yaml_multiple_patterns():
 
 def test_yaml_exclusive_min_max():
     """Test YAML formatter with exclusive minimum/maximum (gt/lt)."""
-    schema = ExclusiveMinMax.model_json_schema()
+    schema = cached_schema(ExclusiveMinMax)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -675,7 +648,7 @@ def test_yaml_exclusive_min_max():
 
 def test_yaml_dict_fields():
     """Test YAML formatter with dict fields."""
-    schema = DictOnlyModel.model_json_schema()
+    schema = cached_schema(DictOnlyModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -685,7 +658,7 @@ def test_yaml_dict_fields():
 
 def test_yaml_additional_properties_false():
     """Test YAML formatter with additionalProperties: false."""
-    schema = ObjectAdditionalPropsFalse.model_json_schema()
+    schema = cached_schema(ObjectAdditionalPropsFalse)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -791,7 +764,7 @@ def test_yaml_formatter_additional_props_false_still_works():
 
 def test_yaml_datetime_fields():
     """Test YAML formatter with datetime fields."""
-    schema = EventWithDate.model_json_schema()
+    schema = cached_schema(EventWithDate)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -808,7 +781,7 @@ def test_yaml_datetime_fields():
 
 def test_yaml_allof_like():
     """Test YAML formatter with allOf-like composition."""
-    schema = AllOfLike.model_json_schema()
+    schema = cached_schema(AllOfLike)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -827,7 +800,7 @@ def test_yaml_allof_like():
 
 def test_yaml_anyof_property_level():
     """Test YAML formatter with anyOf at property level."""
-    schema = UnionTypes.model_json_schema()
+    schema = cached_schema(UnionTypes)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -905,7 +878,7 @@ def test_yaml_dependencies():
 
 def test_yaml_null_type():
     """Test YAML formatter with null type (optional fields)."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = cached_schema(RequiredOptionalModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -933,7 +906,7 @@ def test_yaml_type_array():
 
 def test_yaml_property_order_preservation():
     """Test that YAML formatter preserves property order."""
-    schema = OrderedFieldsModel.model_json_schema()
+    schema = cached_schema(OrderedFieldsModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 
@@ -942,9 +915,19 @@ def test_yaml_property_order_preservation():
     assert names == ["first", "second", "third"], f"Unexpected field order: {names}"
 
 
+def test_yaml_wide_schema_lists_all_fields():
+    """Test YAML formatter renders every field of a 100-field schema in order."""
+    schema = wide_object_schema()
+    formatter = YAMLFormatter(schema, include_metadata=False)
+    result = formatter.transform_schema()
+
+    names = [n for n, _ in parse_yaml_root_fields(result)]
+    assert names == list(schema["properties"])
+
+
 def test_yaml_full_featured_model():
     """Test YAML formatter with kitchen sink model."""
-    schema = FullFeaturedModel.model_json_schema()
+    schema = cached_schema(FullFeaturedModel)
     formatter = YAMLFormatter(schema, include_metadata=True)
     result = formatter.transform_schema()
 
@@ -956,7 +939,7 @@ def test_yaml_full_featured_model():
 
 def test_yaml_consistent_asterisk_usage():
     """Test that asterisk usage is consistent across formatter."""
-    schema = RequiredOptionalModel.model_json_schema()
+    schema = cached_schema(RequiredOptionalModel)
     formatter = YAMLFormatter(schema, include_metadata=False)
     result = formatter.transform_schema()
 